@@ -20,6 +20,7 @@
 #
 
 import inspect
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from typedb.client import *
@@ -27,76 +28,71 @@ from typedb.client import *
 from examples.diagnosis.dataset.pmf import PMF
 
 
+def diagnosis_query(disease):
+    return lambda example_id, values: inspect.cleandoc(f'''
+            match
+            $p isa person, has person-id {example_id};
+            $d isa disease, has name "{disease}";
+            insert
+            $diagnosis (patient: $p, diagnosed-disease: $d) isa diagnosis;
+            $p has age {int(values['age']())};''')
+
+
+def symptom_query(symptom):
+    return lambda example_id, values: inspect.cleandoc(f'''
+            match
+            $p isa person, has person-id {example_id};
+            $s isa symptom, has name "{symptom}";
+            insert
+            $sp (presented-symptom: $s, symptomatic-patient: $p) isa symptom-presentation,
+            has severity {values['severity']()};''')
+
+
+def consumption_query(substance):
+    return lambda example_id, values: inspect.cleandoc(f'''
+            match
+            $p isa person, has person-id {example_id};
+            $s isa substance, has name "{substance}";
+            insert
+            $c (consumer: $p, consumed-substance: $s) isa consumption,
+            has units-per-week {int(values['units-per-week']())};''')
+
+
+def parent_diagnosis_query(disease):
+    return lambda example_id, values: inspect.cleandoc(f'''
+            match
+            $p isa person, has person-id {example_id};
+            $d isa disease, has name "{disease}";
+            insert
+            (parent: $parent, child: $p) isa parentship;
+            $parent isa parent;
+            $diagnosis (patient: $parent, diagnosed-disease: $d) isa familial-diagnosis;
+            ''')
+
+
+# The query to insert for each PMF variable that takes a value other than False. Queries are built in this order,
+# which also fixes the order in which random values are drawn
+QUERY_BUILDERS = {
+    'Multiple Sclerosis': diagnosis_query("Multiple Sclerosis"),
+    'Diabetes Type II': diagnosis_query("Diabetes Type II"),
+    'Fatigue': symptom_query("Fatigue"),
+    'Blurred vision': symptom_query("Blurred vision"),
+    'Drinking': consumption_query("Alcohol"),
+    'Parent has Diabetes Type II': parent_diagnosis_query("Diabetes Type II"),
+    'Cigarettes': consumption_query("Cigarettes"),
+}
+
+
 def get_example_queries(pmf, example_id):
 
     variable_values = pmf.select()
 
     queries = [f'insert $p isa person, has person-id {example_id};']
 
-    if variable_values['Multiple Sclerosis'] is not False:
-        queries.append(inspect.cleandoc(f'''
-                match
-                $d isa disease, has name "Multiple Sclerosis";
-                $p isa person, has person-id {example_id};
-                insert
-                $diagnosis (patient: $p, diagnosed-disease: $d) isa diagnosis;
-                $p has age {int(variable_values['Multiple Sclerosis']['age']())};'''))
-
-    if variable_values['Diabetes Type II'] is not False:
-        queries.append(inspect.cleandoc(f'''                 
-                match
-                $p isa person, has person-id {example_id};
-                $d isa disease, has name "Diabetes Type II";
-                insert
-                $diagnosis (patient: $p, diagnosed-disease: $d) isa diagnosis;
-                $p has age {int(variable_values['Diabetes Type II']['age']())};'''))
-
-    if variable_values['Fatigue'] is not False:
-        queries.append(inspect.cleandoc(f'''
-                match
-                $p isa person, has person-id {example_id};
-                $s isa symptom, has name "Fatigue";
-                insert
-                $sp (presented-symptom: $s, symptomatic-patient: $p) isa 
-                symptom-presentation, has severity {variable_values['Fatigue']['severity']()};'''))
-
-    if variable_values['Blurred vision'] is not False:
-        queries.append(inspect.cleandoc(f'''
-                match
-                $p isa person, has person-id {example_id};
-                $s isa symptom, has name "Blurred vision";
-                insert
-                $sp (presented-symptom: $s, symptomatic-patient: $p) isa 
-                symptom-presentation, has severity {variable_values['Blurred vision']['severity']()};'''))
-
-    if variable_values['Drinking'] is not False:
-        queries.append(inspect.cleandoc(f'''
-                match
-                $p isa person, has person-id {example_id};
-                $s isa substance, has name "Alcohol";
-                insert
-                $c (consumer: $p, consumed-substance: $s) isa consumption, 
-                has units-per-week {int(variable_values['Drinking']['units-per-week']())};'''))
-
-    if variable_values['Parent has Diabetes Type II'] is not False:
-        queries.append(inspect.cleandoc(f'''
-                match
-                $p isa person, has person-id {example_id};
-                $d isa disease, has name "Diabetes Type II";
-                insert
-                (parent: $parent, child: $p) isa parentship;
-                $parent isa parent;
-                $diagnosis (patient: $parent, diagnosed-disease: $d) isa familial-diagnosis;
-                '''))
-
-    if variable_values['Cigarettes'] is not False:
-        queries.append(inspect.cleandoc(f'''
-                match
-                $p isa person, has person-id {example_id};
-                $s isa substance, has name "Cigarettes";
-                insert
-                $c (consumer: $p, consumed-substance: $s) isa consumption, 
-                has units-per-week {int(variable_values['Cigarettes']['units-per-week']())};'''))
+    for variable, build_query in QUERY_BUILDERS.items():
+        values = variable_values[variable]
+        if values is not False:
+            queries.append(build_query(example_id, values))
 
     return queries
 
@@ -130,11 +126,18 @@ def generate_example_data(client, num_examples, database="diagnosis"):
         'Cigarettes':                   [False, {'units-per-week': normal_dist(5, 1)}, {'units-per-week': normal_dist(20, 3)}],
     }, pmf_array, seed=0)
 
-    for example_id in range(0, num_examples):
-        tx = session.transaction(TransactionType.WRITE)
-        for query in get_example_queries(pmf, example_id):
-            tx.query().insert(query)
-        tx.commit()
+    # Draw all examples up front, in order, so that the seeded PMF gives the same data however the writes interleave
+    examples_queries = [get_example_queries(pmf, example_id) for example_id in range(0, num_examples)]
+
+    def insert_example(queries):
+        with session.transaction(TransactionType.WRITE) as tx:
+            for query in queries:
+                tx.query().insert(query)
+            tx.commit()
+
+    # Each example inserts its own person in its own transaction, so the examples can be written concurrently
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(insert_example, examples_queries))
 
     session.close()
 
@@ -60,14 +60,13 @@ class PMF:
         Returns:
             A dict key: variable names; values: the chosen value of each variable
         """
-        flattened = self._pmf_array.flatten()
+        flattened = self._pmf_array.ravel()
 
         answer = {}
 
-        indices = list(np.ndindex(self._pmf_array.shape))
-        int_index = list(range(len(indices)))
-        chosen_int = np.random.choice(int_index, p=flattened)
-        chosen_index = indices[chosen_int]
+        # Choose a flat position and convert it to an index of the array, rather than listing every index
+        chosen_int = np.random.choice(flattened.size, p=flattened)
+        chosen_index = np.unravel_index(chosen_int, self._pmf_array.shape)
         for index, (variable, discrete_values) in zip(chosen_index, self._variables.items()):
             answer[variable] = discrete_values[index]
         return answer
@@ -21,6 +21,7 @@
 import argparse
 import inspect
 import os
+from functools import partial
 
 import networkx as nx
 import torch
@@ -113,8 +114,8 @@ def diagnosis_example(typedb_binary_directory,
 
     edge_types = list({triplet[1] for triplet in edge_type_triplets})
     transform = transforms.Compose([
-        lambda graph: binary_relations_to_edges(graph, RELATION_TYPE_TO_PREDICT[1:4]),
-        lambda graph: nx.convert_node_labels_to_integers(graph, label_attribute="concept"),
+        partial(binary_relations_to_edges, binary_relation_type=RELATION_TYPE_TO_PREDICT[1:4]),
+        partial(nx.convert_node_labels_to_integers, label_attribute="concept"),
         FeatureEncoder(node_types, edge_types, TYPE_ENCODING_SIZE, ATTRIBUTE_ENCODERS, ATTRIBUTE_ENCODING_SIZE),
         LinkPredictionLabeller(RELATION_TYPE_TO_PREDICT[2]),
         store_concepts_by_type,
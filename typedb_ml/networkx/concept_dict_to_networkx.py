@@ -47,18 +47,20 @@ def concept_dict_to_networkx(concept_dict, variable_graph):
                          f'In the concept dict but not in the variable graph: {in_concept_dict_not_in_var_graph}')
 
     # This assumes that all variables are nodes, which would not be the case for variable roles
+    nodes = []
     for variable, thing in concept_dict.items():
         data = variable_graph.nodes[variable]
         data.update(type=thing.type_label)
         if thing.base_type == 'attribute':
             data.update(value_type=thing.value_type, value=thing.value)
 
-        typedb_graph.add_node(thing, **data)
+        nodes.append((thing, data))
 
         # Record the mapping of nodes from one graph to the other
         assert variable not in node_to_var
         node_to_var[variable] = thing
 
+    edges = []
     for sending_var, receiving_var, data in variable_graph.edges(data=True):
         sender = node_to_var[sending_var]
         receiver = node_to_var[receiving_var]
@@ -67,9 +69,9 @@ def concept_dict_to_networkx(concept_dict, variable_graph):
                 receiver.base_type == 'attribute' and data['type'] == 'has'):
             raise ValueError('An edge in the variable_graph originates from a non-relation, check the variable_graph!')
 
-        if data['type'] == 'has':
-            typedb_graph.add_edge(sender, receiver, **data)
-        else:
-            typedb_graph.add_edge(sender, receiver, **data)
+        edges.append((sender, receiver, data))
 
+    # Add in bulk, avoiding the per-call overhead of `add_node` and `add_edge`
+    typedb_graph.add_nodes_from(nodes)
+    typedb_graph.add_edges_from(edges)
     return typedb_graph
@@ -21,7 +21,6 @@
 
 import warnings
 
-from functools import reduce
 import networkx as nx
 
 from typedb_ml.typedb.thing import build_thing
@@ -43,6 +42,8 @@ def build_graph_from_queries(queries, transaction, concept_dict_converter=concep
     """
 
     query_concept_graphs = []
+    # The same concept is typically returned by many answers across the queries, so only build each Thing once
+    things = {}
 
     for query in queries:
 
@@ -50,7 +51,7 @@ def build_graph_from_queries(queries, transaction, concept_dict_converter=concep
         concept_maps = transaction.query().match(query.string)
         print("Query completed")
 
-        concept_dicts = [concept_dict_from_concept_map(concept_map) for concept_map in concept_maps]
+        concept_dicts = [concept_dict_from_concept_map(concept_map, things) for concept_map in concept_maps]
         print("Constructed concept_dicts")
 
         answer_concept_graphs = []
@@ -82,18 +83,29 @@ def build_graph_from_queries(queries, transaction, concept_dict_converter=concep
     return concept_graph
 
 
-def concept_dict_from_concept_map(concept_map):
+def concept_dict_from_concept_map(concept_map, things=None):
     """
     Given a concept map, build a dictionary of the variables present and the concepts they refer to, locally storing any
     information required about those concepts.
 
     Args:
         concept_map: A dict of Concepts provided by TypeDB keyed by query variables
+        things: Optional dict of Things already built, keyed by iid. Things are reused from and added to it
 
     Returns:
         A dictionary of concepts keyed by query variables
     """
-    return {variable: build_thing(typedb_concept) for variable, typedb_concept in concept_map.map().items()}
+    if things is None:
+        return {variable: build_thing(typedb_concept) for variable, typedb_concept in concept_map.map().items()}
+
+    concept_dict = {}
+    for variable, typedb_concept in concept_map.map().items():
+        iid = typedb_concept.get_iid()
+        thing = things.get(iid)
+        if thing is None:
+            thing = things[iid] = build_thing(typedb_concept)
+        concept_dict[variable] = thing
+    return concept_dict
 
 
 def combine_2_graphs(graph1, graph2):
@@ -106,8 +118,25 @@ def combine_2_graphs(graph1, graph2):
         Combined graph
     """
 
-    for node, data in graph1.nodes(data=True):
-        if graph2.has_node(node):
+    check_common_properties_match(graph1, graph2)
+    return nx.compose(graph1, graph2)
+
+
+def check_common_properties_match(graph1, graph2):
+    """
+    Check that the nodes and edges present in both graphs have the same properties in each.
+    Args:
+        graph1: Graph to compare
+        graph2: Graph to compare
+    Raises:
+        ValueError if the properties of a node or edge present in both graphs differ
+    """
+    # Only elements common to both graphs can conflict, so scan the smaller graph and probe the larger one
+    smaller, larger = (graph1, graph2) if len(graph1) <= len(graph2) else (graph2, graph1)
+
+    for node in smaller:
+        if node in larger:
+            data = graph1.nodes[node]
             data2 = graph2.nodes[node]
             if data2 != data:
                 raise ValueError((f'Found non-matching node properties for node {node} '
@@ -115,8 +144,9 @@ def combine_2_graphs(graph1, graph2):
                                   f'In graph {graph1}: {data}\n'
                                   f'In graph {graph2}: {data2}'))
 
-    for sender, receiver, keys, data in graph1.edges(data=True, keys=True):
-        if graph2.has_edge(sender, receiver, keys):
+    for sender, receiver, keys in smaller.edges(keys=True):
+        if larger.has_edge(sender, receiver, keys):
+            data = graph1.edges[sender, receiver, keys]
             data2 = graph2.edges[sender, receiver, keys]
             if data2 != data:
                 raise ValueError((f'Found non-matching edge properties for edge {sender, receiver, keys} '
@@ -124,8 +154,6 @@ def combine_2_graphs(graph1, graph2):
                                   f'In graph {graph1}: {data}\n'
                                   f'In graph {graph2}: {data2}'))
 
-    return nx.compose(graph1, graph2)
-
 
 def combine_n_graphs(graphs_list):
     """
@@ -135,5 +163,12 @@ def combine_n_graphs(graphs_list):
     Returns:
         Combined graph
     """
-    return reduce(lambda x, y: combine_2_graphs(x, y), graphs_list)
+    # Merge into a single graph in-place, since composing pairwise copies the growing combined graph for every graph
+    combined_graph = graphs_list[0].copy()
+    for graph in graphs_list[1:]:
+        check_common_properties_match(combined_graph, graph)
+        combined_graph.graph.update(graph.graph)
+        combined_graph.add_nodes_from(graph.nodes(data=True))
+        combined_graph.add_edges_from(graph.edges(keys=True, data=True))
+    return combined_graph
 
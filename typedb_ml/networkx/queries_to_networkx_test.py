@@ -172,6 +172,19 @@ class TestConceptDictsFromQuery(unittest.TestCase):
 
         self.assertEqual(expected_concept_dict, concept_dicts)
 
+    def test_things_are_reused_across_concept_maps_by_iid(self):
+        things = {}
+        concept_dict_1 = concept_dict_from_concept_map(
+            MockConceptMap({'x': MockThing('V123', MockType('V456', 'person', 'ENTITY'))}), things)
+        concept_dict_2 = concept_dict_from_concept_map(MockConceptMap({
+            'y': MockThing('V123', MockType('V456', 'person', 'ENTITY')),
+            'r': MockThing('V789', MockType('V765', 'employment', 'RELATION')),
+        }), things)
+
+        self.assertEqual({'x': Thing('V123', 'person', 'entity')}, concept_dict_1)
+        self.assertIs(concept_dict_1['x'], concept_dict_2['y'])
+        self.assertSetEqual({'V123', 'V789'}, set(things.keys()))
+
 
 class TestCombineGraphs(GraphTestCase):
 
@@ -205,6 +218,63 @@ class TestCombineGraphs(GraphTestCase):
 
         self.assertGraphsEqual(expected_combined_graph, combined_graph)
 
+    def test_three_graphs_sharing_nodes_and_edges_combined_as_expected(self):
+        person = Thing('V123', 'person', 'entity')
+        employment = Thing('V567', 'employment', 'relation')
+        company = Thing('V890', 'company', 'entity')
+        name = Thing('V1234', 'name', 'attribute', value_type='string', value='Bob')
+
+        typedb_graph_a = nx.MultiDiGraph()
+        typedb_graph_a.add_node(person, type='person')
+        typedb_graph_a.add_node(employment, type='employment')
+        typedb_graph_a.add_edge(employment, person, type='employee')
+
+        typedb_graph_b = nx.MultiDiGraph()
+        typedb_graph_b.add_node(person, type='person')
+        typedb_graph_b.add_node(name, type='name')
+        typedb_graph_b.add_edge(person, name, type='has')
+
+        typedb_graph_c = nx.MultiDiGraph()
+        typedb_graph_c.add_node(person, type='person')
+        typedb_graph_c.add_node(employment, type='employment')
+        typedb_graph_c.add_node(company, type='company')
+        typedb_graph_c.add_edge(employment, person, type='employee')
+        typedb_graph_c.add_edge(employment, company, type='employer')
+
+        combined_graph = combine_n_graphs([typedb_graph_a, typedb_graph_b, typedb_graph_c])
+
+        expected_combined_graph = nx.MultiDiGraph()
+        expected_combined_graph.add_node(person, type='person')
+        expected_combined_graph.add_node(employment, type='employment')
+        expected_combined_graph.add_node(company, type='company')
+        expected_combined_graph.add_node(name, type='name')
+        expected_combined_graph.add_edge(employment, person, type='employee')
+        expected_combined_graph.add_edge(employment, company, type='employer')
+        expected_combined_graph.add_edge(person, name, type='has')
+
+        self.assertGraphsEqual(expected_combined_graph, combined_graph)
+
+    def test_when_third_graph_mismatches_an_earlier_graph_exception_is_raised(self):
+        person_a = Thing('V123', 'person', 'entity')
+        typedb_graph_a = nx.MultiDiGraph(name='a')
+        typedb_graph_a.add_node(person_a, input=1)
+
+        # The second graph doesn't contain the person, so the mismatch is only found against the combined graph
+        name_b = Thing('V1234', 'name', 'attribute', value_type='string', value='Bob')
+        typedb_graph_b = nx.MultiDiGraph(name='b')
+        typedb_graph_b.add_node(name_b, input=1)
+
+        person_c = Thing('V123', 'person', 'entity')
+        typedb_graph_c = nx.MultiDiGraph(name='c')
+        typedb_graph_c.add_node(person_c, input=0)
+
+        with self.assertRaises(ValueError) as context:
+            combine_n_graphs([typedb_graph_a, typedb_graph_b, typedb_graph_c])
+
+        self.assertIn('Found non-matching node properties for node <person, V123>', str(context.exception))
+        self.assertIn('{\'input\': 1}', str(context.exception))
+        self.assertIn('{\'input\': 0}', str(context.exception))
+
     def test_when_graph_node_properties_are_mismatched_exception_is_raised(self):
         person_a = Thing('V123', 'person', 'entity')
         name_a = Thing('V1234', 'name', 'attribute', value_type='string', value='Bob')
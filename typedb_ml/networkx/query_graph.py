@@ -36,8 +36,7 @@ class QueryGraph(nx.MultiDiGraph):
         Returns:
             self
         """
-        for var in vars:
-            self.add_node(var)
+        self.add_nodes_from(vars)
         return self
 
     def add_has_edge(self, owner_var, attribute_var):
@@ -22,6 +22,7 @@
 from typing import Sequence, Callable, Optional
 
 import networkx as nx
+import numpy as np
 from torch_geometric.utils import from_networkx
 from typedb.client import TypeDBSession, TypeDBOptions, TransactionType
 
@@ -30,7 +31,9 @@ from typedb_ml.networkx.queries_to_networkx import build_graph_from_queries
 
 class DataSet:
     """
-    A DataSet to lazily load graphs based on queries from TypeDB and some arbitrary id.
+    A DataSet to lazily load graphs based on queries from TypeDB and some arbitrary id. With `cache_graphs`, the graph
+    queried for each id is kept so that TypeDB is only queried the first time that id is loaded. The cache is unbounded:
+    it holds the untransformed graph of every id loaded, so only enable it when all of those graphs fit in memory.
     """
 
     def __init__(
@@ -42,44 +45,62 @@ class DataSet:
             session: Optional[TypeDBSession] = None,
             infer: bool = True,
             transform: Optional[Callable[[nx.Graph], nx.Graph]] = None,
+            cache_graphs: bool = False,
     ):
         self._indices = indices
-        self._node_types = node_types
-        self._edge_type_triplets = edge_type_triplets
+        self._node_types = tuple(node_types)
+        self._edge_type_triplets = tuple(edge_type_triplets)
+        # Lookup tables from each type to its index, to avoid a linear search per node and per edge
+        self._node_type_index = {node_type: i for i, node_type in enumerate(self._node_types)}
+        self._edge_type_triplet_index = {triplet: i for i, triplet in enumerate(self._edge_type_triplets)}
         self.queries_for_id = queries_for_id
-        self._infer = infer
+        self._options = TypeDBOptions.core()
+        self._options.infer = infer
         self._transform = transform
         self.session = session
+        self._graph_cache = {} if cache_graphs else None
 
     def __len__(self):
         return len(self._indices)
 
     def __getitem__(self, idx):
         id = self._indices[idx]
+        if self._graph_cache is None:
+            graph = self.query_graph(id)
+        else:
+            if id not in self._graph_cache:
+                self._graph_cache[id] = self.query_graph(id)
+            # Transforms modify the graph in-place, so give them a copy to keep the cached graph intact
+            graph = self._graph_cache[id].copy()
+        if self._transform:
+            graph = self._transform(graph)
+        data = from_networkx(graph)
+        data.concepts_by_type = graph.concepts_by_type
+        return data, self.node_type_indices(graph), self.edge_type_indices(graph)
+
+    def query_graph(self, id):
         print(f"Fetching graph for id: {id}")
         queries = self.queries_for_id(id)
 
-        options = TypeDBOptions.core()
-        options.infer = self._infer
-
-        with self.session.transaction(TransactionType.READ, options=options) as tx:
+        with self.session.transaction(TransactionType.READ, options=self._options) as tx:
             # Build a graph from the queries
             graph = build_graph_from_queries(queries, tx)
         graph.name = id
-        if self._transform:
-            graph = self._transform(graph)
-        data = from_networkx(graph)
-        data.concepts_by_type = graph.concepts_by_type
-        return data, self.node_type_indices(graph), self.edge_type_indices(graph)
+        return graph
 
     def node_type_indices(self, graph):
-        indices = []
-        for _, data in graph.nodes(data=True):
-            indices.append(self._node_types.index(data['type']))
-        return indices
+        # Built directly as an int64 array so that it converts to a tensor without a copy
+        return np.fromiter(
+            (self._node_type_index[typ] for _, typ in graph.nodes(data="type")),
+            dtype=np.int64,
+            count=graph.number_of_nodes(),
+        )
 
     def edge_type_indices(self, graph):
-        indices = []
-        for src, dst, data in graph.edges(data=True):
-            indices.append(self._edge_type_triplets.index((graph.nodes[src]["type"], data["type"], graph.nodes[dst]["type"])))
-        return indices
+        node_types = dict(graph.nodes(data="type"))
+        return np.fromiter(
+            (self._edge_type_triplet_index[(node_types[src], typ, node_types[dst])]
+             for src, dst, typ in graph.edges(data="type")),
+            dtype=np.int64,
+            count=graph.number_of_edges(),
+        )
@@ -0,0 +1,128 @@
+#
+#  Copyright (C) 2022 Vaticle
+#
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+#
+
+import unittest
+
+import networkx as nx
+
+from typedb_ml.networkx.query_graph import QueryGraph, Query
+from typedb_ml.pytorch_geometric.dataset.dataset import DataSet
+from typedb_ml.pytorch_geometric.transform.binary_link_prediction import binary_relations_to_edges
+from typedb_ml.pytorch_geometric.transform.common import store_concepts_by_type
+from typedb_ml.typedb.test.mock.answer import MockConceptMap
+from typedb_ml.typedb.test.mock.concept import MockType, MockThing
+
+QUERY = 'match $p isa person; $d isa disease; $r(patient: $p, diagnosed-disease: $d) isa diagnosis;'
+
+
+def queries_for_id(id):
+    query_graph = (QueryGraph()
+                   .add_vars(['p', 'd', 'r'])
+                   .add_role_edge('r', 'p', 'patient')
+                   .add_role_edge('r', 'd', 'diagnosed-disease'))
+    return [Query(query_graph, QUERY)]
+
+
+class MockSession:
+    def __init__(self):
+        self.transactions_opened = 0
+
+    def transaction(self, transaction_type, options=None):
+        self.transactions_opened += 1
+        return MockTransaction()
+
+
+class MockTransaction:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def query(self):
+        return MockQueryManager()
+
+
+class MockQueryManager:
+    def match(self, query):
+        assert query == QUERY
+        return [MockConceptMap({
+            'p': MockThing('V123', MockType('V1', 'person', 'ENTITY')),
+            'd': MockThing('V456', MockType('V2', 'disease', 'ENTITY')),
+            'r': MockThing('V789', MockType('V3', 'diagnosis', 'RELATION')),
+        })]
+
+
+class TestDataSet(unittest.TestCase):
+
+    def setUp(self):
+        self.session = MockSession()
+        self.graphs_transformed = []
+
+        def transform(graph):
+            # Record what the transform is given before modifying the graph in-place
+            self.graphs_transformed.append(sorted(typ for _, typ in graph.nodes(data='type')))
+            binary_relations_to_edges(graph, ('patient', 'diagnosis', 'diagnosed-disease'))
+            return store_concepts_by_type(nx.convert_node_labels_to_integers(graph, label_attribute='concept'))
+
+        self.transform = transform
+
+    def create_dataset(self, cache_graphs):
+        return DataSet(
+            [0], ['person', 'disease'], [('person', 'diagnosis', 'disease')], queries_for_id, self.session,
+            transform=self.transform, cache_graphs=cache_graphs
+        )
+
+    def test_query_graph_builds_graph_from_queries(self):
+        graph = self.create_dataset(cache_graphs=False).query_graph(0)
+
+        self.assertEqual(0, graph.name)
+        self.assertCountEqual(['person', 'disease', 'diagnosis'], [typ for _, typ in graph.nodes(data='type')])
+        self.assertCountEqual(['patient', 'diagnosed-disease'], [typ for _, _, typ in graph.edges(data='type')])
+
+    def test_graph_is_queried_for_every_item_without_cache(self):
+        dataset = self.create_dataset(cache_graphs=False)
+        dataset[0]
+        dataset[0]
+        self.assertEqual(2, self.session.transactions_opened)
+
+    def test_graph_is_queried_once_with_cache(self):
+        dataset = self.create_dataset(cache_graphs=True)
+        dataset[0]
+        dataset[0]
+        self.assertEqual(1, self.session.transactions_opened)
+
+    def test_in_place_transform_does_not_modify_cached_graph(self):
+        dataset = self.create_dataset(cache_graphs=True)
+        _, node_type_indices_1, edge_type_indices_1 = dataset[0]
+        _, node_type_indices_2, edge_type_indices_2 = dataset[0]
+
+        # The relation node is replaced in the transformed graph, but is still present for the second transform
+        expected = ['diagnosis', 'disease', 'person']
+        self.assertEqual([expected, expected], self.graphs_transformed)
+        self.assertCountEqual([0, 1], node_type_indices_2)
+        self.assertEqual([0], list(edge_type_indices_2))
+        self.assertEqual(list(node_type_indices_1), list(node_type_indices_2))
+        self.assertEqual(list(edge_type_indices_1), list(edge_type_indices_2))
+
+
+if __name__ == "__main__":
+    unittest.main()
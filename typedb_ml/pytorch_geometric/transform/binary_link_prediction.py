@@ -20,7 +20,6 @@
 #
 import networkx as nx
 
-from typedb_ml.networkx.iterate import multidigraph_edge_data_iterator
 from typedb_ml.typedb.type import get_edge_type_triplets, reverse_edge_type_triplets
 
 
@@ -34,7 +33,7 @@ class LinkPredictionLabeller:
         return graph
 
     def label_edges(self, graph):
-        for data in multidigraph_edge_data_iterator(graph):
+        for _, _, data in graph.edges(data=True):
             if data["type"] == self.edge_type_to_predict:
                 data["y_edge"] = 1
             else:
@@ -62,12 +61,14 @@ def binary_relations_to_edges(graph: nx.MultiDiGraph, binary_relation_type):
         binary_relation_type: A triple of the `(role1, relation, role2)` types to convert to a single edge labelled with `relation`
 
     Returns:
-        Dict of edges to the node each replaces
+        The same graph, with the relations replaced by edges
     """
-    replacement_edges = {}
+    # Stage the replacements and apply them in bulk once all relations have been checked
+    relation_nodes = []
+    binary_edges = []
     for node, node_data in graph.nodes(data=True):
         if node_data["type"] == binary_relation_type[1]:
-            if len(list(graph.in_edges(node))) > 0:
+            if graph.pred[node]:
                 raise ValueError(
                     "The given binary relation can't be transformed into an edge because it plays a role in another "
                     "relation."
@@ -92,17 +93,18 @@ def binary_relations_to_edges(graph: nx.MultiDiGraph, binary_relation_type):
                         f"Unexpected role in relation {binary_relation_type[1]}. Expected \""
                         f"{binary_relation_type[0]}\" or \"{binary_relation_type[2]}\" but got \"{data['type']}\"."
                     )
-                graph.remove_edge(from_roleplayer, to_roleplayer)
-            graph.add_edge(new_edge_start, new_edge_end, type=binary_relation_type[1])
-            replacement_edges[(new_edge_start, new_edge_end)] = node
-    for node in replacement_edges.values():
-        graph.remove_node(node)
+            relation_nodes.append(node)
+            binary_edges.append((new_edge_start, new_edge_end, {"type": binary_relation_type[1]}))
+    # Removing the relation nodes also removes their role edges
+    graph.remove_nodes_from(relation_nodes)
+    graph.add_edges_from(binary_edges)
     return graph
 
 
 def binary_link_prediction_edge_triplets(session, relation_type_to_predict, types_to_ignore):
     edge_type_triplets = get_edge_type_triplets(session)
-    edge_type_triplets = [e for e in edge_type_triplets if not (set(e).intersection(types_to_ignore))]
+    types_to_ignore = set(types_to_ignore)
+    edge_type_triplets = [e for e in edge_type_triplets if types_to_ignore.isdisjoint(e)]
     replace_relation_with_binary_edge(edge_type_triplets, relation_type_to_predict)
     edge_type_triplets_reversed = reverse_edge_type_triplets(edge_type_triplets)
     return edge_type_triplets, edge_type_triplets_reversed
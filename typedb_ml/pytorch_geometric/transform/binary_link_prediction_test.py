@@ -0,0 +1,109 @@
+#
+#  Copyright (C) 2022 Vaticle
+#
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+#
+
+import unittest
+
+import networkx as nx
+
+from typedb_ml.pytorch_geometric.transform.binary_link_prediction import binary_relations_to_edges
+
+
+class TestBinaryRelationsToEdges(unittest.TestCase):
+
+    def test_relation_is_replaced_by_edge(self):
+        graph = nx.MultiDiGraph()
+        graph.add_node('p', type='person')
+        graph.add_node('d', type='disease')
+        graph.add_node('r', type='diagnosis')
+        graph.add_edge('r', 'p', type='patient')
+        graph.add_edge('r', 'd', type='diagnosed-disease')
+
+        binary_relations_to_edges(graph, ('patient', 'diagnosis', 'diagnosed-disease'))
+
+        self.assertCountEqual(['p', 'd'], list(graph.nodes))
+        self.assertCountEqual([('p', 'd', {'type': 'diagnosis'})], list(graph.edges(data=True)))
+
+    def test_two_relations_between_the_same_roleplayers_are_both_replaced(self):
+        graph = nx.MultiDiGraph()
+        graph.add_node('p', type='person')
+        graph.add_node('d', type='disease')
+        # Not part of any relation, to check that unrelated nodes are kept
+        graph.add_node('q', type='person')
+        graph.add_node('r1', type='diagnosis')
+        graph.add_node('r2', type='diagnosis')
+        graph.add_edge('r1', 'p', type='patient')
+        graph.add_edge('r1', 'd', type='diagnosed-disease')
+        graph.add_edge('r2', 'p', type='patient')
+        graph.add_edge('r2', 'd', type='diagnosed-disease')
+
+        binary_relations_to_edges(graph, ('patient', 'diagnosis', 'diagnosed-disease'))
+
+        self.assertCountEqual(['d', 'p', 'q'], list(graph.nodes))
+        self.assertCountEqual(
+            [('p', 'd', {'type': 'diagnosis'}), ('p', 'd', {'type': 'diagnosis'})],
+            list(graph.edges(data=True))
+        )
+
+    def test_relation_with_symmetric_roles_is_replaced_by_edge(self):
+        graph = nx.MultiDiGraph()
+        graph.add_node('a', type='person')
+        graph.add_node('b', type='person')
+        graph.add_node('r', type='siblingship')
+        graph.add_edge('r', 'a', type='sibling')
+        graph.add_edge('r', 'b', type='sibling')
+
+        binary_relations_to_edges(graph, ('sibling', 'siblingship', 'sibling'))
+
+        self.assertCountEqual(['a', 'b'], list(graph.nodes))
+        edges = list(graph.edges(data=True))
+        self.assertEqual(1, len(edges))
+        self.assertCountEqual({'a', 'b'}, set(edges[0][:2]))
+        self.assertDictEqual({'type': 'siblingship'}, edges[0][2])
+
+    def test_exception_raised_and_graph_unchanged_when_relation_plays_a_role(self):
+        graph = nx.MultiDiGraph()
+        graph.add_node('p', type='person')
+        graph.add_node('d', type='disease')
+        graph.add_node('r1', type='diagnosis')
+        graph.add_node('r2', type='diagnosis')
+        graph.add_node('c', type='confirmation')
+        graph.add_edge('r1', 'p', type='patient')
+        graph.add_edge('r1', 'd', type='diagnosed-disease')
+        graph.add_edge('r2', 'p', type='patient')
+        graph.add_edge('r2', 'd', type='diagnosed-disease')
+        graph.add_edge('c', 'r2', type='confirmed')
+        original_nodes = list(graph.nodes(data=True))
+        original_edges = list(graph.edges(keys=True, data=True))
+
+        with self.assertRaises(ValueError) as context:
+            binary_relations_to_edges(graph, ('patient', 'diagnosis', 'diagnosed-disease'))
+
+        self.assertEqual(
+            "The given binary relation can't be transformed into an edge because it plays a role in another relation.",
+            str(context.exception)
+        )
+        # The valid relation found before the invalid one must not have been replaced either
+        self.assertEqual(original_nodes, list(graph.nodes(data=True)))
+        self.assertEqual(original_edges, list(graph.edges(keys=True, data=True)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,18 +18,16 @@
 #  specific language governing permissions and limitations
 #  under the License.
 #
-from typedb_ml.networkx.iterate import multidigraph_node_data_iterator, multidigraph_edge_data_iterator
-
 
 def clear_unneeded_fields(graph):
-    for node_data in multidigraph_node_data_iterator(graph):
+    for _, node_data in graph.nodes(data=True):
         x = node_data["x"]
         t = node_data["type"]
         node_data.clear()
         node_data["x"] = x
         node_data["type"] = t
 
-    for edge_data in multidigraph_edge_data_iterator(graph):
+    for _, _, edge_data in graph.edges(data=True):
         x = edge_data["edge_attr"]
         y = edge_data["y_edge"]
         t = edge_data["type"]
@@ -50,7 +48,7 @@ def store_concepts_by_type(graph):
         The same graph, with a field `concepts_by_type` holding concepts organised by type
     """
     concepts_by_type = {}
-    for node_data in multidigraph_node_data_iterator(graph):
+    for _, node_data in graph.nodes(data=True):
         typ = node_data['type']
         if typ in concepts_by_type:
             concepts_by_type[typ].append(node_data['concept'])
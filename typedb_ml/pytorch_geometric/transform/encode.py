@@ -23,11 +23,6 @@ from typing import List
 import torch
 from torch.nn import Embedding
 
-from typedb_ml.networkx.iterate import (
-    multidigraph_node_data_iterator,
-    multidigraph_edge_data_iterator,
-)
-
 
 class FeatureEncoder:
     """
@@ -38,46 +33,75 @@ class FeatureEncoder:
     """
 
     def __init__(self, node_types, edge_types, type_encoding_size, attribute_encoders, attribute_encoding_size):
-        self.node_types = node_types
-        self.edge_types = edge_types
+        # Stored as tuples so they can't drift out of sync with the index lookups built from them
+        self.node_types = tuple(node_types)
+        self.edge_types = tuple(edge_types)
+        self._node_type_index = {node_type: i for i, node_type in enumerate(self.node_types)}
+        self._edge_type_index = {edge_type: i for i, edge_type in enumerate(self.edge_types)}
         self.attribute_encoders = attribute_encoders
         self.attribute_encoding_size = attribute_encoding_size
         self.node_type_embedding = Embedding(len(self.node_types), type_encoding_size)
         self.edge_type_embedding = Embedding(len(self.edge_types), type_encoding_size)
+        # Built once and shared by every edge, since edges have no attribute values to encode
+        self._no_attribute_encoding = torch.zeros(self.attribute_encoding_size)
 
     def __call__(self, graph):
         self.encode_node_features(graph)
         self.encode_edge_features(graph)
         return graph
 
+    # The features are stored as numpy arrays, detached from the embeddings, so no autograd graph needs recording
+    @torch.no_grad()
     def encode_node_features(self, graph):
-        for node_data in multidigraph_node_data_iterator(graph):
+        nodes_data = [node_data for _, node_data in graph.nodes(data=True)]
+        # Look up the type embeddings of all nodes with a single call to the embedding
+        type_embeddings = self.node_type_embedding(torch.as_tensor(
+            [self._node_type_index[node_data['type']] for node_data in nodes_data], dtype=torch.long
+        ))
+        # Fill a single pre-allocated feature matrix rather than concatenating new tensors for every node. Nodes
+        # without an attribute encoder keep the zeros it is initialised with
+        type_encoding_size = type_embeddings.shape[1]
+        x = torch.zeros(len(nodes_data), type_encoding_size + self.attribute_encoding_size)
+        x[:, :type_encoding_size] = type_embeddings
+        for i, node_data in enumerate(nodes_data):
             typ = node_data['type']
-            if typ in self.attribute_encoders.keys():
+            if typ in self.attribute_encoders:
                 # Add the integer value of the category for each categorical attribute instance
-                encoded_value = self.attribute_encoders[typ](node_data['value'])
-            else:
-                encoded_value = [0] * self.attribute_encoding_size
-
-            type_embedding = self.node_type_embedding(torch.as_tensor(self.node_types.index(node_data['type'])))
-            node_data['x'] = torch.hstack([type_embedding, torch.as_tensor(encoded_value)])\
-                .cpu().detach().numpy()  # Conversion to numpy array, otherwise the graph representation breaks
-
+                encoded_value = torch.as_tensor(self.attribute_encoders[typ](node_data['value']))
+                # Check the shape explicitly, since assigning into the slice would broadcast a single value across it
+                if encoded_value.shape != (self.attribute_encoding_size,):
+                    raise ValueError(
+                        f'The attribute encoder for type "{typ}" gave an encoding of shape '
+                        f'{tuple(encoded_value.shape)}, expected ({self.attribute_encoding_size},)'
+                    )
+                x[i, type_encoding_size:] = encoded_value
+
+        x = x.cpu().detach().numpy()  # Conversion to numpy array, otherwise the graph representation breaks
+        for node_data, node_x in zip(nodes_data, x):
+            node_data['x'] = node_x
+
+    @torch.no_grad()
     def encode_edge_features(self, graph):
-        for edge_data in multidigraph_edge_data_iterator(graph):
-            type_embedding = self.node_type_embedding(torch.as_tensor(self.edge_types.index(edge_data['type'])))
-            edge_data['edge_attr'] = torch.hstack([type_embedding, torch.as_tensor([0] * self.attribute_encoding_size)])\
-                .cpu().detach().numpy()  # Conversion to numpy array, otherwise the graph representation breaks
+        edges_data = [edge_data for _, _, edge_data in graph.edges(data=True)]
+        # Edges carry no attribute values, so the features of all edges can be built as a single tensor
+        type_embeddings = self.edge_type_embedding(torch.as_tensor(
+            [self._edge_type_index[edge_data['type']] for edge_data in edges_data], dtype=torch.long
+        ))
+        edge_attrs = torch.hstack([type_embeddings, self._no_attribute_encoding.expand(len(edges_data), -1)])\
+            .cpu().detach().numpy()  # Conversion to numpy array, otherwise the graph representation breaks
+        for edge_data, edge_attr in zip(edges_data, edge_attrs):
+            edge_data['edge_attr'] = edge_attr
 
 
 class CategoricalEncoder:
 
     def __init__(self, categories: List, attribute_encoding_size):
-        self.categories = categories
+        self.categories = tuple(categories)
+        self._category_index = {category: i for i, category in enumerate(self.categories)}
         self.embedding = Embedding(len(self.categories), attribute_encoding_size)
 
     def __call__(self, value):
-        return self.embedding(torch.as_tensor(self.categories.index(value)))
+        return self.embedding(torch.as_tensor(self._category_index[value]))
 
 
 class ContinuousEncoder:
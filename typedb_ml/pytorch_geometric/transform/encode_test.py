@@ -0,0 +1,101 @@
+#
+#  Copyright (C) 2022 Vaticle
+#
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+#
+
+import unittest
+
+import networkx as nx
+import numpy as np
+
+from typedb_ml.pytorch_geometric.transform.encode import FeatureEncoder, CategoricalEncoder, ContinuousEncoder
+
+
+class TestFeatureEncoder(unittest.TestCase):
+
+    def test_node_features_are_type_embedding_followed_by_attribute_encoding(self):
+        node_types = ['person', 'name', 'age']
+        type_encoding_size = 4
+        attribute_encoding_size = 3
+        name_encoder = CategoricalEncoder(['Alice', 'Bob'], attribute_encoding_size)
+        attribute_encoders = {
+            'name': name_encoder,
+            'age': ContinuousEncoder(0, 100, attribute_encoding_size),
+        }
+        encoder = FeatureEncoder(node_types, ['has'], type_encoding_size, attribute_encoders, attribute_encoding_size)
+
+        graph = nx.MultiDiGraph()
+        graph.add_node(0, type='person')
+        graph.add_node(1, type='name', value='Bob')
+        graph.add_node(2, type='age', value=25)
+
+        encoder(graph)
+
+        node_type_weights = encoder.node_type_embedding.weight.detach().numpy()
+        expected_attribute_encodings = {
+            0: np.zeros(attribute_encoding_size),
+            1: name_encoder.embedding.weight[1].detach().numpy(),
+            2: np.full(attribute_encoding_size, 0.25),
+        }
+        for node, node_data in graph.nodes(data=True):
+            expected_x = np.concatenate([
+                node_type_weights[node_types.index(node_data['type'])], expected_attribute_encodings[node]
+            ])
+            np.testing.assert_allclose(expected_x, node_data['x'], rtol=1e-6)
+
+    def test_exception_raised_when_attribute_encoding_has_wrong_size(self):
+        attribute_encoders = {'age': lambda value: [value]}
+        encoder = FeatureEncoder(['age'], ['has'], 4, attribute_encoders, 3)
+
+        graph = nx.MultiDiGraph()
+        graph.add_node(0, type='age', value=25)
+
+        with self.assertRaises(ValueError) as context:
+            encoder(graph)
+
+        self.assertEqual('The attribute encoder for type "age" gave an encoding of shape (1,), expected (3,)',
+                         str(context.exception))
+
+    def test_edge_features_use_edge_type_embedding(self):
+        # More edge types than node types, so indexing the node type embedding with an edge type would fail
+        node_types = ['person']
+        edge_types = ['friendship', 'employment', 'marriage']
+        type_encoding_size = 4
+        attribute_encoding_size = 3
+        encoder = FeatureEncoder(node_types, edge_types, type_encoding_size, {}, attribute_encoding_size)
+
+        graph = nx.MultiDiGraph()
+        graph.add_node(0, type='person')
+        graph.add_node(1, type='person')
+        graph.add_edge(0, 1, type='marriage')
+        graph.add_edge(1, 0, type='employment')
+
+        encoder(graph)
+
+        edge_type_weights = encoder.edge_type_embedding.weight.detach().numpy()
+        for _, _, edge_data in graph.edges(data=True):
+            edge_attr = edge_data['edge_attr']
+            np.testing.assert_allclose(
+                edge_type_weights[edge_types.index(edge_data['type'])], edge_attr[:type_encoding_size]
+            )
+            np.testing.assert_array_equal(np.zeros(attribute_encoding_size), edge_attr[type_encoding_size:])
+
+
+if __name__ == "__main__":
+    unittest.main()